@@ -0,0 +1,24 @@
+"""
+Creational Design Patterns:
+    Importing the package is cheap, the pattern modules are imported
+    lazily on first attribute access:
+
+        import Creational
+        Creational.builder.ConstructionDirector()
+"""
+
+import importlib
+
+__all__ = ['abstract_factory', 'builder', 'factory_method', 'prototype', 'singleton']
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
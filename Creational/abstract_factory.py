@@ -8,7 +8,10 @@ Abstract Factory Design Pattern in Python:
     It's like a factory of factories.
 """
 
+import sys
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from functools import lru_cache
 
 # Abstract Products
 class AbstractProductA(ABC):
@@ -72,10 +75,11 @@ def client_code(factory: AbstractFactory):
     print(product_b.useful_function_b())
 
 # Usage
-print("\nClient: Testing client code with the first factory type:")
-client_code(ConcreteFactory1())
-print("\nClient: Testing the same client code with the second factory type:")
-client_code(ConcreteFactory2())
+if __name__ == '__main__':
+    print("\nClient: Testing client code with the first factory type:")
+    client_code(ConcreteFactory1())
+    print("\nClient: Testing the same client code with the second factory type:")
+    client_code(ConcreteFactory2())
 
 
 
@@ -178,6 +182,64 @@ class MacOsFactory(GUIFactory):
     def create_checkbox(self):
         return MacOsCheckBox()
 
+# Product families created in one call
+ProductFamily = namedtuple('ProductFamily', 'product_a product_b')
+GUIFamily = namedtuple('GUIFamily', 'button checkbox')
+
+
+# Flyweight factory
+class SharedProductFactory:
+    """
+    Wraps a concrete factory whose products are stateless: every create_*
+    call returns one shared product instead of allocating a new one, and
+    create_family() returns a prebound bundle of the whole family.
+    family is a namedtuple whose fields name create_* methods of the
+    factory; without it one is built from all the create_* methods.
+    """
+    def __init__(self, factory, family=None):
+        self._factory = factory
+        products = {}
+        for name in dir(factory):
+            if name.startswith('create_'):
+                product = products[name[len('create_'):]] = getattr(factory, name)()
+                setattr(self, name, lambda product=product: product)
+        if family is None:
+            family = namedtuple(f'{type(factory).__name__}Family', products)
+        missing = [field for field in family._fields if field not in products]
+        if missing:
+            raise ValueError(
+                f'{type(factory).__name__} has no create_{missing[0]}() for '
+                f'{family.__name__}.{missing[0]}'
+            )
+        bundle = family(*(products[field] for field in family._fields))
+        self.create_family = lambda: bundle
+
+
+@lru_cache(maxsize=None)
+def get_gui_factory():
+    # the platform factory is picked once per process
+    factory = MacOsFactory() if sys.platform == 'darwin' else WindowsFactory()
+    return SharedProductFactory(factory, GUIFamily)
+
+
+def benchmark(n=1_000_000):
+    # families/sec: fresh products from the factory versus the shared bundle
+    import time
+
+    factory = WindowsFactory()
+    start = time.perf_counter()
+    for _ in range(n):
+        GUIFamily(factory.create_button(), factory.create_checkbox())
+    fresh_time = time.perf_counter() - start
+
+    create_family = get_gui_factory().create_family
+    start = time.perf_counter()
+    for _ in range(n):
+        create_family()
+    shared_time = time.perf_counter() - start
+    return {'fresh_per_sec': n / fresh_time, 'shared_per_sec': n / shared_time}
+
+
 def client_code(factory):
     button = factory.create_button()
     checkbox = factory.create_checkbox()
@@ -185,7 +247,8 @@ def client_code(factory):
     print(button.show())
     print(checkbox.show())
 
-print("\nClient: Testing client code with Windows factory:")
-client_code(WindowsFactory())
-print("\nClient: Testing client code with MacOS factory:")
-client_code(MacOsFactory())
\ No newline at end of file
+if __name__ == '__main__':
+    print("\nClient: Testing client code with Windows factory:")
+    client_code(WindowsFactory())
+    print("\nClient: Testing client code with MacOS factory:")
+    client_code(MacOsFactory())
\ No newline at end of file
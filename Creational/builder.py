@@ -39,22 +39,70 @@ Key Components:
                                 └─────────────────┘
 """
 
+import copy
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import partial
+from itertools import repeat
 
 
 #Product
 class House:
-    def __init__(self):
-        self.foundation = None
-        self.walls = None
-        self.roof = None
+    __slots__ = ('foundation', 'walls', 'roof')
+
+    def __init__(self, foundation=None, walls=None, roof=None):
+        self.foundation = foundation
+        self.walls = walls
+        self.roof = roof
     
     def __str__(self):
         return (f'house with foundation={self.foundation}, walls={self.walls}, roof={self.roof}')
 
 
+#Immutable product, shared between identical builds
+class FrozenHouse:
+    __slots__ = ('foundation', 'walls', 'roof', '__weakref__')
+
+    def __init__(self, foundation=None, walls=None, roof=None):
+        object.__setattr__(self, 'foundation', foundation)
+        object.__setattr__(self, 'walls', walls)
+        object.__setattr__(self, 'roof', roof)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+    
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+    
+    def _parts(self):
+        return (self.foundation, self.walls, self.roof)
+    
+    def __eq__(self, other):
+        if not isinstance(other, FrozenHouse):
+            return NotImplemented
+        return self._parts() == other._parts()
+    
+    def __hash__(self):
+        return hash(self._parts())
+    
+    def __reduce__(self):
+        return (FrozenHouse, self._parts())
+    
+    __str__ = House.__str__
+
+
 # Abstract Builder
 class HouseBuilder(ABC):
+    # builders whose steps always produce the same parts may set this,
+    # which lets the director hand out one shared FrozenHouse per key
+    deterministic = False
+    # reentrant builders accept the house to build as an optional argument
+    # of every step (build_x(self, house=None), defaulting to self.house),
+    # so one builder can work on many houses at once and across threads.
+    # Other builders keep the stateful contract: steps write to self.house.
+    reentrant = False
+
     def __init__(self):
         self.house = None
         
@@ -64,6 +112,21 @@ class HouseBuilder(ABC):
     def get_house(self):
         return self.house
     
+    def parameters(self):
+        # anything besides the builder type that changes the product
+        return ()
+    
+    def _steps_for(self, house):
+        # the three steps bound to `house`; a stateful builder is copied so
+        # concurrent builds never share self.house
+        if self.reentrant:
+            return (partial(self.build_foundation, house),
+                    partial(self.build_walls, house),
+                    partial(self.build_roof, house))
+        builder = copy.copy(self)
+        builder.house = house
+        return (builder.build_foundation, builder.build_walls, builder.build_roof)
+    
     @abstractmethod
     def build_foundation(self):
         pass
@@ -79,26 +142,57 @@ class HouseBuilder(ABC):
 
 #Concrete Builder 1
 class HouseOneBuilder(HouseBuilder):
-    def build_foundation(self):
-        self.house.foundation = 'one'
+    deterministic = True
+    reentrant = True
+
+    def build_foundation(self, house=None):
+        (house or self.house).foundation = 'one'
     
-    def build_roof(self):
-        self.house.roof = 'stone'
+    def build_roof(self, house=None):
+        (house or self.house).roof = 'stone'
     
-    def build_walls(self):
-        self.house.walls = '10'
+    def build_walls(self, house=None):
+        (house or self.house).walls = '10'
 
 
 #Concrete Builder 2
 class HouseTwoBuilder(HouseBuilder):
-    def build_foundation(self):
-        self.house.foundation = 'two'
+    deterministic = True
+    reentrant = True
+
+    def build_foundation(self, house=None):
+        (house or self.house).foundation = 'two'
     
-    def build_roof(self):
-        self.house.roof = 'wooden'
+    def build_roof(self, house=None):
+        (house or self.house).roof = 'wooden'
     
-    def build_walls(self):
-        self.house.walls = '20'
+    def build_walls(self, house=None):
+        (house or self.house).walls = '20'
+
+
+#Records the parts a builder sets, in order
+class _RecordingHouse:
+    def __init__(self):
+        object.__setattr__(self, 'steps', [])
+    
+    def __setattr__(self, name, value):
+        self.steps.append((name, value))
+
+
+#Compiled construction plan
+class ConstructionPlan:
+    """
+    A builder's step sequence recorded once and replayed without calling
+    the builder again. Only valid for builders whose steps always set the
+    same parts.
+    """
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+        parts = dict(self.steps)
+        self._args = tuple(parts.get(name) for name in House.__slots__)
+    
+    def execute(self):
+        return House(*self._args)
 
 
 # Director
@@ -117,6 +211,236 @@ class ConstructionDirector:
         self.house_builder.build_foundation()
         self.house_builder.build_walls()
         self.house_builder.build_roof()
+    
+    def compile(self):
+        recorder = _RecordingHouse()
+        for build_step in self.house_builder._steps_for(recorder):
+            build_step()
+        return ConstructionPlan(recorder.steps)
+    
+    def construct_interned(self):
+        builder = self.house_builder
+        if not builder.deterministic:
+            return FrozenHouse(**dict(self.compile().steps))
+        key = (type(builder), builder.parameters())
+        house = _interned_houses.get(key)
+        if house is None:
+            house = _interned_houses[key] = FrozenHouse(**dict(self.compile().steps))
+        return house
+    
+    def construct_many(self, n, executor=None, max_pending=64):
+        return self.construct_batch(repeat(self.house_builder, n), executor, max_pending)
+    
+    def construct_batch(self, specs, executor=None, max_pending=64):
+        # specs is an iterable of builders; finished houses are streamed back
+        # in order while at most max_pending builds are in flight
+        if executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor() as executor:
+                yield from self.construct_batch(specs, executor, max_pending)
+            return
+        pending = deque()
+        for builder in specs:
+            pending.append(executor.submit(build_house, builder))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+_interned_houses = weakref.WeakValueDictionary()
+
+
+def build_house(builder, executor=None):
+    # builds one house without touching builder.house, so it is safe to call
+    # concurrently with any builder. Walls and roof only need the
+    # foundation, so with an executor they are built in parallel.
+    house = House()
+    build_foundation, build_walls, build_roof = builder._steps_for(house)
+    build_foundation()
+    if executor is None:
+        build_walls()
+        build_roof()
+    else:
+        walls = executor.submit(build_walls)
+        roof = executor.submit(build_roof)
+        walls.result()
+        roof.result()
+    return house
+
+
+def step(part, requires=(), params=()):
+    # marks a coroutine of an AsyncHouseBuilder as the step building `part`.
+    # It receives the parts it requires as keyword arguments; its result is
+    # memoized on those parts and the builder attributes listed in params.
+    def decorate(func):
+        func.part = part
+        func.requires = tuple(requires)
+        func.params = tuple(params)
+        return func
+    return decorate
+
+
+# Abstract Async Builder
+class AsyncHouseBuilder(ABC):
+    @classmethod
+    def steps(cls):
+        steps = {}
+        for name in dir(cls):
+            func = getattr(cls, name)
+            if hasattr(func, 'part'):
+                steps[func.part] = func
+        return steps
+
+
+#Concrete Async Builder
+class AsyncCustomHouseBuilder(AsyncHouseBuilder):
+    # delay stands in for I/O such as fetching specs or rendering parts
+    def __init__(self, foundation='one', walls='10', roof='stone', delay=0.0):
+        self.foundation = foundation
+        self.walls = walls
+        self.roof = roof
+        self.delay = delay
+    
+    async def _fetch(self, value):
+        import asyncio
+        await asyncio.sleep(self.delay)
+        return value
+    
+    @step('foundation', params=('foundation',))
+    async def build_foundation(self):
+        return await self._fetch(self.foundation)
+    
+    @step('walls', requires=('foundation',), params=('walls',))
+    async def build_walls(self, foundation):
+        return await self._fetch(self.walls)
+    
+    @step('roof', requires=('foundation',), params=('roof',))
+    async def build_roof(self, foundation):
+        return await self._fetch(self.roof)
+
+
+# Async Director
+class AsyncConstructionDirector:
+    """
+    Schedules a builder's steps as a DAG: every step starts as soon as the
+    parts it requires are built, so independent steps run concurrently.
+    Step results are memoized, so a rebuild after changing one parameter
+    only reruns the steps that depend on it.
+    """
+    def __init__(self):
+        self._cache = {}
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+    
+    async def construct(self, builder):
+        import asyncio
+        from graphlib import TopologicalSorter
+
+        # validate the whole graph before any step is scheduled
+        steps = builder.steps()
+        graph = {part: func.requires for part, func in steps.items()}
+        order = list(TopologicalSorter(graph).static_order())
+        for part in order:
+            if part not in steps:
+                raise ValueError(f'no step builds the required part {part!r}')
+
+        async def run(func):
+            inputs = {part: await tasks[part] for part in func.requires}
+            key = (
+                type(builder), func.part,
+                tuple(inputs.items()),
+                tuple(getattr(builder, name) for name in func.params),
+            )
+            if key in self._cache:
+                self.hits += 1
+                return self._cache[key]
+            # identical steps of concurrent constructs share one task; each
+            # waits on it through shield() so cancelling one construct does
+            # not cancel the others, and only the last waiter cancels it
+            entry = self._inflight.get(key)
+            if entry is None:
+                self.misses += 1
+                entry = self._inflight[key] = [asyncio.ensure_future(compute(func, key, inputs)), 0]
+            else:
+                self.hits += 1
+            task = entry[0]
+            entry[1] += 1
+            try:
+                return await asyncio.shield(task)
+            finally:
+                entry[1] -= 1
+                if entry[1] == 0 and not task.done():
+                    task.cancel()
+                if (task.done() or entry[1] == 0) and self._inflight.get(key) is entry:
+                    del self._inflight[key]
+
+        async def compute(func, key, inputs):
+            value = self._cache[key] = await func(builder, **inputs)
+            return value
+
+        tasks = {part: asyncio.ensure_future(run(steps[part])) for part in order}
+        try:
+            values = await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return House(**dict(zip(tasks, values)))
+
+
+def benchmark(n=1_000_000):
+    # houses/sec per builder type: construct() versus a compiled plan
+    import time
+
+    results = {}
+    director = ConstructionDirector()
+    for builder in (HouseOneBuilder(), HouseTwoBuilder()):
+        director.set_house_builder(builder)
+
+        start = time.perf_counter()
+        for _ in range(n):
+            director.construct()
+            director.get_house()
+        construct_time = time.perf_counter() - start
+
+        execute = director.compile().execute
+        start = time.perf_counter()
+        for _ in range(n):
+            execute()
+        plan_time = time.perf_counter() - start
+
+        results[type(builder).__name__] = {
+            'construct_per_sec': n / construct_time,
+            'plan_per_sec': n / plan_time,
+        }
+    return results
+
+
+def benchmark_interned(n=1_000_000):
+    # time and retained memory for n builds kept alive by the caller
+    import time
+    import tracemalloc
+
+    director = ConstructionDirector()
+    director.set_house_builder(HouseOneBuilder())
+
+    def construct():
+        director.construct()
+        return director.get_house()
+
+    results = {}
+    for label, build in (('construct', construct), ('interned', director.construct_interned)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        houses = [build() for _ in range(n)]
+        elapsed = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[label] = {'seconds': elapsed, 'bytes': memory, 'unique': len(set(map(id, houses)))}
+        del houses
+    return results
 
 
 def client(house_type):
@@ -127,4 +451,5 @@ def client(house_type):
     print(house)
 
 
-client(HouseOneBuilder())
\ No newline at end of file
+if __name__ == '__main__':
+    client(HouseOneBuilder())
\ No newline at end of file
@@ -14,7 +14,9 @@ Factory Method Design Pattern in Python:
     └───────────────┘       └───────────────┘
 """
 
+import time
 from abc import ABC, abstractmethod
+from collections import deque
 
 # Product interface
 class Document(ABC):
@@ -62,14 +64,254 @@ class WordDocumentCreator(DocumentCreator):
     def factory_method(self):
         return WordDocument()
 
+# Registry of Document products keyed by format
+class DocumentRegistry:
+    """
+    O(1) format -> product dispatch. Plugins can add formats through the
+    entry point group below; they are loaded on the first unknown format,
+    so startup only pays for the built-in products.
+    """
+    def __init__(self, entry_point_group='design_pattern.documents'):
+        self._products = {}
+        self._pooled = set()
+        self._shared = {}
+        self._creators = {}
+        self._entry_point_group = entry_point_group
+        self._plugins_loaded = entry_point_group is None
+    
+    def register(self, key, product_cls, pooled=False):
+        # pooled products are stateless, so one instance is shared per key
+        self._products[key] = product_cls
+        self._shared.pop(key, None)
+        if pooled:
+            self._pooled.add(key)
+        else:
+            self._pooled.discard(key)
+    
+    def unregister(self, key):
+        del self._products[key]
+        self._shared.pop(key, None)
+        self._creators.pop(key, None)
+        self._pooled.discard(key)
+    
+    def create(self, key):
+        document = self._shared.get(key)
+        if document is not None:
+            return document
+        product_cls = self._products.get(key)
+        if product_cls is None:
+            product_cls = self._load_plugin(key)
+        document = product_cls()
+        if key in self._pooled:
+            self._shared[key] = document
+        return document
+    
+    def creator(self, key):
+        creator = self._creators.get(key)
+        if creator is None:
+            # resolve the format first, so unknown keys are never cached
+            if key not in self._products:
+                self._load_plugin(key)
+            creator = self._creators[key] = RegistryDocumentCreator(key, self)
+        return creator
+    
+    def formats(self):
+        self._load_plugins()
+        return list(self._products)
+    
+    def _load_plugin(self, key):
+        self._load_plugins()
+        try:
+            return self._products[key]
+        except KeyError:
+            raise KeyError(f'unknown document format: {key!r}') from None
+    
+    def _load_plugins(self):
+        if self._plugins_loaded:
+            return
+        self._plugins_loaded = True
+        from importlib import metadata
+        for entry_point in metadata.entry_points(group=self._entry_point_group):
+            if entry_point.name not in self._products:
+                self.register(entry_point.name, entry_point.load())
+
+
+# Concrete Creator backed by the registry
+class RegistryDocumentCreator(DocumentCreator):
+    def __init__(self, key, registry):
+        self.key = key
+        self._registry = registry
+    
+    def factory_method(self):
+        return self._registry.create(self.key)
+
+
+document_registry = DocumentRegistry()
+document_registry.register('pdf', PDFDocument, pooled=True)
+document_registry.register('html', HTMLDocument, pooled=True)
+document_registry.register('word', WordDocument, pooled=True)
+
+
 # Client code
 def export_document(creator: DocumentCreator):
     print(f"Exporting document: {creator.operation()}")
 
 
-export_document(PDFDocumentCreator())
-export_document(HTMLDocumentCreator())
-export_document(WordDocumentCreator())
+def _render_batch(creator, payloads):
+    operation = creator.operation
+    lines = [f"Exporting document {payload}: {operation()}\n" for payload in payloads]
+    return ''.join(lines), len(lines), time.perf_counter()
+
+
+# Batch export pipeline
+class ExportPipeline:
+    """
+    Streams (format, payload) jobs through the registry. Jobs are grouped
+    by format so each batch reuses one creator, batches are rendered on a
+    worker pool and their output goes through a buffered writer. At most
+    max_pending batches are in flight; the producer waits beyond that.
+    A batch is submitted once it holds batch_size jobs or its oldest job
+    is max_delay seconds old, and buffered output is written at least every
+    max_delay seconds, so rare formats still stream (the age checks run as
+    jobs arrive). Output is written batch by batch, not in job order. Jobs
+    with an unknown format and batches that fail to render are counted in
+    the metrics instead of aborting the run.
+    """
+    def __init__(self, output, registry=None, workers=4, batch_size=256,
+                 max_pending=8, buffer_size=64 * 1024, max_delay=0.1):
+        self.output = output
+        self.registry = registry or document_registry
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.buffer_size = buffer_size
+        self.max_delay = max_delay
+    
+    def run(self, jobs):
+        self._buffer = []
+        self._buffered = 0
+        self._latencies = []
+        self._count = 0
+        self._rejected = {}
+        self._failed = 0
+        self._errors = []
+        start = self._last_flush = time.perf_counter()
+        next_check = start + self.max_delay
+        groups = {}
+        pending = deque()
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(self.workers) as executor:
+            try:
+                for fmt, payload in jobs:
+                    group = groups.get(fmt)
+                    if group is None:
+                        try:
+                            creator = self.registry.creator(fmt)
+                        except KeyError:
+                            # unknown formats are counted, not rendered
+                            self._rejected[fmt] = self._rejected.get(fmt, 0) + 1
+                            continue
+                        group = groups[fmt] = [creator, [], 0.0]
+                    payloads = group[1]
+                    if not payloads:
+                        group[2] = time.perf_counter()
+                    payloads.append(payload)
+                    if len(payloads) >= self.batch_size:
+                        self._submit(executor, pending, group)
+                    now = time.perf_counter()
+                    if now >= next_check:
+                        self._flush_aged(executor, pending, groups, now)
+                        next_check = now + self.max_delay / 4
+                for group in groups.values():
+                    if group[1]:
+                        self._submit(executor, pending, group)
+            finally:
+                while pending:
+                    self._collect(pending.popleft())
+                self._flush()
+        return self._metrics(time.perf_counter() - start)
+    
+    def _flush_aged(self, executor, pending, groups, now):
+        deadline = now - self.max_delay
+        for group in groups.values():
+            if group[1] and group[2] <= deadline:
+                self._submit(executor, pending, group)
+        while pending and pending[0][1].done():
+            self._collect(pending.popleft())
+        if self._buffer and self._last_flush <= deadline:
+            self._flush()
+    
+    def _submit(self, executor, pending, group):
+        creator, payloads, _ = group
+        group[1] = []
+        if len(pending) >= self.max_pending:
+            self._collect(pending.popleft())
+        future = executor.submit(_render_batch, creator, payloads)
+        pending.append((time.perf_counter(), future, len(payloads)))
+    
+    def _collect(self, item):
+        # a failing batch is reported in the metrics and does not stop the run
+        submitted, future, size = item
+        try:
+            text, count, finished = future.result()
+        except Exception as e:
+            self._failed += size
+            self._errors.append(repr(e))
+            return
+        # submit -> render finished, independent of when it is collected
+        self._latencies.append(finished - submitted)
+        self._count += count
+        self._buffer.append(text)
+        self._buffered += len(text)
+        if self._buffered >= self.buffer_size:
+            self._flush()
+    
+    def _flush(self):
+        self._last_flush = time.perf_counter()
+        if self._buffer:
+            self.output.write(''.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+    
+    def _metrics(self, elapsed):
+        latencies = sorted(self._latencies)
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] if latencies else 0.0
+        return {
+            'jobs': self._count,
+            'batches': len(latencies),
+            'seconds': elapsed,
+            'jobs_per_sec': self._count / elapsed if elapsed else 0.0,
+            'batch_latency_p50': percentile(0.5),
+            'batch_latency_p99': percentile(0.99),
+            'rejected': dict(self._rejected),
+            'failed_jobs': self._failed,
+            'errors': list(self._errors),
+        }
+
+
+def benchmark(n=1_000_000):
+    # operations/sec: a new creator subclass instance per request versus registry dispatch
+    creators = {'pdf': PDFDocumentCreator, 'html': HTMLDocumentCreator, 'word': WordDocumentCreator}
+    formats = [('pdf', 'html', 'word')[i % 3] for i in range(n)]
+
+    start = time.perf_counter()
+    for fmt in formats:
+        creators[fmt]().operation()
+    subclass_time = time.perf_counter() - start
+
+    creator = document_registry.creator
+    start = time.perf_counter()
+    for fmt in formats:
+        creator(fmt).operation()
+    registry_time = time.perf_counter() - start
+    return {'subclass_per_sec': n / subclass_time, 'registry_per_sec': n / registry_time}
+
+
+if __name__ == '__main__':
+    export_document(PDFDocumentCreator())
+    export_document(HTMLDocumentCreator())
+    export_document(WordDocumentCreator())
 
 
 """
@@ -207,5 +449,6 @@ def create_animal(animal:AnimalCreator):
     return animal.operation()
 
 
-create_animal(DogCreator())
-create_animal(DuckCreator())
\ No newline at end of file
+if __name__ == '__main__':
+    create_animal(DogCreator())
+    create_animal(DuckCreator())
\ No newline at end of file
@@ -21,7 +21,11 @@ Prototype Design Pattern in Python:
 
 
 import copy
+import mmap
+import struct
+import zlib
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
 
 
 class Prototype(ABC):
@@ -42,8 +46,289 @@ class ConcretePrototype(Prototype):
     
     def clone(self, name, **kwargs):
         cloned_obj = copy.deepcopy(self._objects[name])
-        cloned_obj.__dict__.update(kwargs)
+        _set_attributes(cloned_obj, kwargs)
         return cloned_obj
+    
+    def clone_many(self, name, overrides_iterable):
+        # look the template up once and clone it for every overrides dict
+        template = self._objects[name]
+        deepcopy = copy.deepcopy
+        for overrides in overrides_iterable:
+            cloned_obj = deepcopy(template)
+            _set_attributes(cloned_obj, overrides)
+            yield cloned_obj
+    
+    def clone_columns(self, name, /, **columns):
+        # column oriented batch: clone_columns('p', name=[...], age=[...]);
+        # every column must have the same length
+        keys = tuple(columns)
+        rows = zip(*columns.values(), strict=True)
+        return self.clone_many(name, (dict(zip(keys, row)) for row in rows))
+    
+    def save(self, path):
+        save_snapshot(self._objects, path)
+    
+    @classmethod
+    def load(cls, path):
+        # templates are deserialized lazily on first clone(name)
+        prototype = cls()
+        prototype._objects = _SnapshotObjects(path)
+        return prototype
+    
+    def close(self):
+        # releases the memory-mapped snapshot of a loaded registry
+        close = getattr(self._objects, 'close', None)
+        if close is not None:
+            close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# Snapshot file layout (little endian):
+#   header : magic, version, entry count, index size, index crc32
+#   index  : per entry -> name length, name, blob offset, blob length, blob crc32
+#   blobs  : pickled templates
+SNAPSHOT_MAGIC = b'PRTS'
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct('<4sHIII')
+_ENTRY = struct.Struct('<HQQI')
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def save_snapshot(objects, path):
+    import pickle
+    blobs = [(name.encode(), pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)) for name, obj in objects.items()]
+    index_size = sum(_ENTRY.size + len(name) for name, _ in blobs)
+    offset = _HEADER.size + index_size
+    index = bytearray()
+    for name, blob in blobs:
+        index += _ENTRY.pack(len(name), offset, len(blob), zlib.crc32(blob))
+        index += name
+        offset += len(blob)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(blobs), len(index), zlib.crc32(index)))
+        f.write(index)
+        for _, blob in blobs:
+            f.write(blob)
+
+
+#Lazy registry backed by a memory-mapped snapshot
+class _SnapshotObjects(MutableMapping):
+    def __init__(self, path):
+        self._loaded = {}
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # mmap refuses empty files
+                raise SnapshotError(f'cannot map snapshot: {e}') from e
+        try:
+            self._index = self._read_index()
+        except BaseException:
+            self._mmap.close()
+            raise
+    
+    def _read_index(self):
+        with memoryview(self._mmap) as buf:
+            try:
+                magic, version, count, index_size, index_crc = _HEADER.unpack_from(buf)
+            except struct.error:
+                raise SnapshotError('truncated snapshot header') from None
+            if magic != SNAPSHOT_MAGIC:
+                raise SnapshotError('not a prototype snapshot')
+            if version != SNAPSHOT_VERSION:
+                raise SnapshotError(f'unsupported snapshot version {version}')
+            end = _HEADER.size + index_size
+            if end > len(buf):
+                raise SnapshotError('truncated snapshot index')
+            if zlib.crc32(buf[_HEADER.size:end]) != index_crc:
+                raise SnapshotError('snapshot index checksum mismatch')
+            index = {}
+            pos = _HEADER.size
+            try:
+                for _ in range(count):
+                    name_len, offset, length, crc = _ENTRY.unpack_from(buf, pos)
+                    pos += _ENTRY.size
+                    name = bytes(buf[pos:pos + name_len]).decode()
+                    pos += name_len
+                    if pos > end or offset + length > len(buf):
+                        raise SnapshotError(f'truncated snapshot entry {name!r}')
+                    index[name] = (offset, length, crc)
+            except (struct.error, UnicodeDecodeError) as e:
+                raise SnapshotError(f'corrupt snapshot index: {e}') from e
+            if pos != end:
+                raise SnapshotError('snapshot index size mismatch')
+            return index
+    
+    def __getitem__(self, name):
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        offset, length, crc = self._index[name]
+        if self._mmap.closed:
+            raise SnapshotError('snapshot is closed')
+        import pickle
+        with memoryview(self._mmap) as buf, buf[offset:offset + length] as blob:
+            if zlib.crc32(blob) != crc:
+                raise SnapshotError(f'snapshot entry {name!r} checksum mismatch')
+            obj = self._loaded[name] = pickle.loads(blob)
+        return obj
+    
+    def __setitem__(self, name, obj):
+        self._loaded[name] = obj
+    
+    def __delitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+        self._loaded.pop(name, None)
+        self._index.pop(name, None)
+    
+    def __contains__(self, name):
+        return name in self._loaded or name in self._index
+    
+    def __iter__(self):
+        yield from self._loaded
+        for name in list(self._index):
+            if name not in self._loaded:
+                yield name
+    
+    def __len__(self):
+        return len(self._loaded.keys() | self._index.keys())
+    
+    def close(self):
+        self._mmap.close()
+
+
+# works for both __dict__ and __slots__ based objects
+def _set_attributes(obj, attributes):
+    for name, value in attributes.items():
+        setattr(obj, name, value)
+
+
+def _slot_names(cls):
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__'):
+                yield name
+
+
+def _get_attributes(obj):
+    attributes = {}
+    for name in _slot_names(type(obj)):
+        if hasattr(obj, name):
+            attributes[name] = getattr(obj, name)
+    attributes.update(getattr(obj, '__dict__', {}))
+    return attributes
+
+
+def _reset_attributes(obj, attributes):
+    # drop everything that is not in attributes, then restore attributes
+    instance_dict = getattr(obj, '__dict__', None)
+    if instance_dict is not None:
+        instance_dict.clear()
+    for name in _slot_names(type(obj)):
+        if name not in attributes and hasattr(obj, name):
+            delattr(obj, name)
+    _set_attributes(obj, attributes)
+
+
+#Object pool
+class PrototypePool:
+    """
+    Recycles released clones instead of allocating new ones.
+    A released object is reset to the template attributes (shallow copy)
+    and loses any attribute its previous user added, so the pool is meant
+    for templates whose attribute values are immutable.
+    """
+    def __init__(self, prototype, name, max_size=1024):
+        self._state = _get_attributes(prototype._objects[name])
+        self._prototype = prototype
+        self._name = name
+        self._max_size = max_size
+        self._free = []
+    
+    def acquire(self, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            _set_attributes(obj, kwargs)
+            return obj
+        return self._prototype.clone(self._name, **kwargs)
+    
+    def acquire_many(self, overrides_iterable):
+        for overrides in overrides_iterable:
+            yield self.acquire(**overrides)
+    
+    def release(self, obj):
+        if len(self._free) < self._max_size:
+            _reset_attributes(obj, self._state)
+            self._free.append(obj)
+    
+    def __len__(self):
+        return len(self._free)
+
+
+def benchmark(n=100_000):
+    # objects/sec and gc collections for clone() in a loop, clone_many() and the pool
+    import gc
+    import time
+
+    prototype = ConcretePrototype()
+    prototype.register('p', Person('a', 15))
+    overrides = [{'age': i} for i in range(n)]
+    pool = PrototypePool(prototype, 'p')
+
+    def loop():
+        return [prototype.clone('p', **o) for o in overrides]
+
+    def many():
+        return list(prototype.clone_many('p', overrides))
+
+    def pooled():
+        for obj in pool.acquire_many(overrides):
+            pool.release(obj)
+
+    results = {}
+    for label, func in (('clone', loop), ('clone_many', many), ('pool', pooled)):
+        gc.collect()
+        before = sum(stat['collections'] for stat in gc.get_stats())
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        after = sum(stat['collections'] for stat in gc.get_stats())
+        results[label] = {'objects_per_sec': n / elapsed, 'gc_collections': after - before}
+    return results
+
+
+def benchmark_cold_start(path, templates=10_000):
+    # snapshot load + first clone versus rebuilding the registry by hand
+    import time
+
+    def rebuild():
+        prototype = ConcretePrototype()
+        for i in range(templates):
+            prototype.register(f'p{i}', Person(f'name{i}', i))
+        return prototype
+
+    rebuild().save(path)
+
+    start = time.perf_counter()
+    rebuild().clone('p0')
+    rebuild_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ConcretePrototype.load(path).clone('p0')
+    load_time = time.perf_counter() - start
+    return {'rebuild_sec': rebuild_time, 'snapshot_sec': load_time}
+
 
 def client(name, obj, **kwargs):
     concrete_prototype = ConcretePrototype()
@@ -53,12 +338,17 @@ def client(name, obj, **kwargs):
 
 
 class Person:
+    # clone() may override any attribute, so besides the slots Person keeps
+    # a __dict__ that is only allocated once an extra attribute is set
+    __slots__ = ('name', 'age', '__dict__')
+
     def __init__(self, name, age):
         self.name = name
         self.age = age
 
 
-person_1 = Person('a', 15)
-c_person_1 = client('p', person_1, age=20)
+if __name__ == '__main__':
+    person_1 = Person('a', 15)
+    c_person_1 = client('p', person_1, age=20)
 
-print(person_1 is c_person_1)
\ No newline at end of file
+    print(person_1 is c_person_1)
\ No newline at end of file
@@ -15,9 +15,10 @@ class Singleton:
         return cls._instance
 
 
-s1 = Singleton()
-s2 = Singleton()
-print(s1 is s2)
+if __name__ == '__main__':
+    s1 = Singleton()
+    s2 = Singleton()
+    print(s1 is s2)
 
 
 # MetaClass Implementation
@@ -34,9 +35,10 @@ class MyClass(metaclass=SingletonMeta):
         pass
 
 
-s_1 = MyClass()
-s_2 = MyClass()
-print(s_1 is s_2)
+if __name__ == '__main__':
+    s_1 = MyClass()
+    s_2 = MyClass()
+    print(s_1 is s_2)
 
 
 
@@ -25,6 +25,100 @@ class MediaPlayer:
         print(f'playing mp3 file : {filename}')
 
 
+#Ring of reusable chunk buffers
+class RingBuffer:
+    __slots__ = ('_views', '_index')
+
+    def __init__(self, chunk_size, slots=4):
+        self._views = [memoryview(bytearray(chunk_size)) for _ in range(slots)]
+        self._index = 0
+    
+    def next_slot(self):
+        view = self._views[self._index]
+        self._index = (self._index + 1) % len(self._views)
+        return view
+
+
+#Buffer adapter
+class ChunkAdapter:
+    """
+    Connects a byte producer to a consumer that wants fixed size chunks.
+    Everything goes through the buffer protocol: whole chunks are handed
+    on as memoryview slices of the producer's buffers, only the bytes that
+    straddle a chunk boundary are staged in a ring buffer slot, and a
+    producer with readinto() fills the ring slots directly.
+
+    Chunks staged in the ring are reused once the ring wraps around, so a
+    chunk passed to consumer.write() is only guaranteed valid until
+    slots - 1 further staged chunks have been written. On the readinto()
+    path every chunk is staged; with feed() only the chunks assembled from
+    boundary bytes are. Consumers must copy chunks they keep for longer.
+    """
+    __slots__ = ('_consumer', '_chunk_size', '_ring', '_partial', '_filled')
+
+    def __init__(self, consumer, chunk_size, slots=4):
+        self._consumer = consumer
+        self._chunk_size = chunk_size
+        self._ring = RingBuffer(chunk_size, slots)
+        self._partial = None
+        self._filled = 0
+    
+    def feed(self, data):
+        view = memoryview(data).cast('B')
+        size = self._chunk_size
+        write = self._consumer.write
+        if self._partial is not None:
+            count = min(size - self._filled, len(view))
+            self._partial[self._filled:self._filled + count] = view[:count]
+            self._filled += count
+            view = view[count:]
+            if self._filled < size:
+                return
+            write(self._partial)
+            self._partial = None
+        end = len(view) - len(view) % size
+        for start in range(0, end, size):
+            write(view[start:start + size])
+        if end < len(view):
+            self._partial = self._ring.next_slot()
+            self._filled = len(view) - end
+            self._partial[:self._filled] = view[end:]
+    
+    def flush(self):
+        if self._partial is not None:
+            self._consumer.write(self._partial[:self._filled])
+            self._partial = None
+    
+    def pump(self, producer):
+        # producer is either a file-like object with readinto() or an
+        # iterable of bytes-like chunks
+        readinto = getattr(producer, 'readinto', None)
+        if readinto is None:
+            for data in producer:
+                self.feed(data)
+        else:
+            size = self._chunk_size
+            write = self._consumer.write
+            # complete a partial chunk left by feed() before starting new ones
+            slot, filled = self._partial, self._filled
+            self._partial = None
+            if slot is None:
+                slot, filled = self._ring.next_slot(), 0
+            while True:
+                while filled < size:
+                    count = readinto(slot[filled:])
+                    if not count:
+                        break
+                    filled += count
+                if filled < size:
+                    if filled:
+                        self._partial, self._filled = slot, filled
+                    break
+                write(slot)
+                slot, filled = self._ring.next_slot(), 0
+        self.flush()
+
+
 def client():
     mp4service = Mp4PService()
     media_adaptor = MediaAdapter()
@@ -34,6 +128,5 @@ def client():
     media_player.play_mp3(converted)
 
 
-client()
-
-
+if __name__ == '__main__':
+    client()
@@ -0,0 +1,283 @@
+"""
+Benchmark suites for the pattern hot paths.
+
+Every suite reports ops/sec, p50/p99 latency per call and the peak memory
+traced by tracemalloc over TRACED_CALLS calls (peak_traced_bytes, not a
+per-call allocation count). Results can be saved as a JSON baseline and
+later compared against it:
+
+    python benchmarks.py                          # run every suite
+    python benchmarks.py composite prototype      # run some suites
+    python benchmarks.py --save baseline.json
+    python benchmarks.py --compare baseline.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+SUITES = {}
+
+# calls measured under tracemalloc for peak_traced_bytes
+TRACED_CALLS = 1_000
+
+
+def suite(name):
+    # a suite is a function returning the zero-argument callable to measure
+    def register(setup):
+        SUITES[name] = setup
+        return setup
+    return register
+
+
+def fake_sleep(seconds):
+    pass
+
+
+@suite('proxy')
+def proxy_receive():
+    from proxy import ProxyServer, Server
+    return ProxyServer(Server(sleep=fake_sleep), log_path=os.devnull).receive
+
+
+@suite('protection_proxy')
+def protection_proxy_check(roles=1_000, permissions=100):
+    # roles * permissions = 10**5 rules
+    from proxy import AccessPolicy, Principal
+    policy = AccessPolicy(
+        (f'role{r}', f'perm{(r + p) % permissions}') for r in range(roles) for p in range(permissions)
+    )
+    principal = Principal('alice', frozenset(f'role{r}' for r in range(0, roles, 200)))
+    return lambda: policy.check(principal, 'perm42')
+
+
+@suite('facade')
+def facade_start():
+    from facade import Computer
+    return Computer().start
+
+
+def make_tree(depth=4, fanout=4):
+    from composite import Composite, Leaf
+    def build(level, name):
+        if level == depth:
+            return Leaf(name)
+        node = Composite(name)
+        for i in range(fanout):
+            node.add(build(level + 1, f'{name}.{i}'))
+        return node
+    return build(0, 'root')
+
+
+@suite('composite')
+def composite_operation():
+    return make_tree().operation
+
+
+@suite('prototype')
+def prototype_clone():
+    from Creational.prototype import ConcretePrototype, Person
+    prototype = ConcretePrototype()
+    prototype.register('p', Person('a', 15))
+    return lambda: prototype.clone('p', age=20)
+
+
+@suite('builder')
+def builder_construct():
+    from Creational.builder import ConstructionDirector, HouseOneBuilder
+    director = ConstructionDirector()
+    director.set_house_builder(HouseOneBuilder())
+    return director.construct
+
+
+@suite('singleton')
+def singleton_call():
+    from Creational.singleton import MyClass
+    return MyClass
+
+
+@suite('factory_method')
+def factory_method_dispatch():
+    from Creational.factory_method import PDFDocumentCreator
+    return lambda: PDFDocumentCreator().operation()
+
+
+@suite('factory_method_registry')
+def factory_method_registry_dispatch():
+    from Creational.factory_method import document_registry
+    return lambda: document_registry.creator('pdf').operation()
+
+
+@suite('abstract_factory')
+def abstract_factory_dispatch():
+    from Creational.abstract_factory import WindowsFactory
+    factory = WindowsFactory()
+    return lambda: (factory.create_button(), factory.create_checkbox())
+
+
+@suite('abstract_factory_shared')
+def abstract_factory_shared_dispatch():
+    from Creational.abstract_factory import get_gui_factory
+    return get_gui_factory().create_family
+
+
+def measure(func, n):
+    # demos print, so output is discarded while measuring
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for _ in range(n):
+            func()
+        elapsed = time.perf_counter() - start
+
+        clock = time.perf_counter_ns
+        latencies = []
+        for _ in range(min(n, 10_000)):
+            t0 = clock()
+            func()
+            latencies.append(clock() - t0)
+        latencies.sort()
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        for _ in range(TRACED_CALLS):
+            func()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': n / elapsed,
+        'p50_ns': latencies[len(latencies) // 2],
+        'p99_ns': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        'peak_traced_bytes': peak,
+    }
+
+
+def run(names, n):
+    return {name: measure(SUITES[name](), n) for name in names}
+
+
+def compare(results, baseline):
+    lines = []
+    for name, metrics in results.items():
+        old = baseline.get(name)
+        if old is None:
+            lines.append(f'{name:28} (no baseline)')
+            continue
+        diffs = []
+        for key, value in metrics.items():
+            if old.get(key):
+                diffs.append(f'{key} {100 * (value - old[key]) / old[key]:+.1f}%')
+        lines.append(f'{name:28} ' + ', '.join(diffs))
+    return '\n'.join(lines)
+
+
+def load_test(clients=32, requests=20, service_time=0.01, rate=2_000.0, burst=50,
+              max_queue=64, batch_window=0.005):
+    # bursty clients against SmartReferenceProxy and a Server with a fixed service time
+    import threading
+    from proxy import Server, ServerOverloaded, SmartReferenceProxy
+    proxy = SmartReferenceProxy(Server(service_time=service_time), rate=rate, burst=burst,
+                                max_queue=max_queue, batch_window=batch_window)
+    outcomes = {'ok': 0, 'overloaded': 0}
+    lock = threading.Lock()
+
+    def client():
+        for _ in range(requests):
+            try:
+                proxy.receive()
+                outcome = 'ok'
+            except ServerOverloaded:
+                outcome = 'overloaded'
+            with lock:
+                outcomes[outcome] += 1
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        threads = [threading.Thread(target=client) for _ in range(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        proxy.close()
+    return dict(outcomes, seconds=elapsed, **proxy.stats())
+
+
+def adapter_throughput(total=256 << 20, produced=96 << 10, chunk_size=4096):
+    # GB/s re-chunking a stream with ChunkAdapter versus bytes concatenation
+    from adapter import ChunkAdapter
+
+    class Counter:
+        def __init__(self):
+            self.bytes = 0
+
+        def write(self, chunk):
+            self.bytes += len(chunk)
+
+    payload = bytes(produced)
+    blocks = total // produced
+
+    def naive(consumer):
+        pending = b''
+        for _ in range(blocks):
+            pending += payload
+            while len(pending) >= chunk_size:
+                consumer.write(pending[:chunk_size])
+                pending = pending[chunk_size:]
+        if pending:
+            consumer.write(pending)
+
+    def adapted(consumer):
+        ChunkAdapter(consumer, chunk_size).pump(payload for _ in range(blocks))
+
+    results = {}
+    for label, func in (('naive', naive), ('adapter', adapted)):
+        consumer = Counter()
+        start = time.perf_counter()
+        func(consumer)
+        elapsed = time.perf_counter() - start
+        results[label] = {'bytes': consumer.bytes, 'gb_per_sec': consumer.bytes / elapsed / 1e9}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pattern benchmarks')
+    parser.add_argument('suites', nargs='*', help=f"any of: {', '.join(sorted(SUITES))}")
+    parser.add_argument('-n', type=int, default=100_000, help='calls per suite')
+    parser.add_argument('--save', help='write results to a JSON baseline')
+    parser.add_argument('--compare', help='compare results with a JSON baseline')
+    parser.add_argument('--load-test', action='store_true', help='run the SmartReferenceProxy load test')
+    parser.add_argument('--adapter-throughput', action='store_true', help='run the ChunkAdapter throughput test')
+    args = parser.parse_args(argv)
+    if args.adapter_throughput:
+        print(json.dumps(adapter_throughput(), indent=2))
+        return 0
+    if args.load_test:
+        print(json.dumps(load_test(), indent=2))
+        return 0
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    results = run(args.suites or sorted(SUITES), args.n)
+    for name, metrics in results.items():
+        print(f"{name:28} {metrics['ops_per_sec']:>14,.0f} ops/s  "
+              f"p50 {metrics['p50_ns']:>8} ns  p99 {metrics['p99_ns']:>8} ns  "
+              f"peak {metrics['peak_traced_bytes']:>8} B / {TRACED_CALLS} calls")
+    if args.compare:
+        with open(args.compare) as f:
+            print('\n' + compare(results, json.load(f)))
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -15,6 +15,8 @@ from abc import ABC, abstractmethod
 
 #Abstraction
 class Abstraction(ABC):
+    __slots__ = ('_implementation',)
+
     def __init__(self, implementation):
         self._implementation = implementation
     
@@ -24,17 +26,23 @@ class Abstraction(ABC):
 
 #RefinedAbstraction
 class RefinedAbstractionOne(Abstraction):
+    __slots__ = ()
+
     def perform_action(self):
         self._implementation.action_implementation()
 
 
 #RefinedAbstraction
 class RefinedAbstractionTwo(Abstraction):
+    __slots__ = ()
+
     def perform_action(self):
         self._implementation.action_implementation()
 
 #Implementor
 class Implementation(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def action_implementation(self):
         pass
@@ -42,12 +50,16 @@ class Implementation(ABC):
 
 #ConcreteImplementor
 class ConcreteImplementationOne(Implementation):
+    __slots__ = ()
+
     def action_implementation(self):
         print(self.__class__.__name__)
 
 
 #ConcreteImplementor
 class ConcreteImplementationTwo(Implementation):
+    __slots__ = ()
+
     def action_implementation(self):
         print(self.__class__.__name__)
 
@@ -63,4 +75,5 @@ def client():
     r_2.perform_action()
 
 
-client()
\ No newline at end of file
+if __name__ == '__main__':
+    client()
@@ -16,12 +16,16 @@ from abc import ABC,  abstractmethod
 
 #Abstract Component
 class Component(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def operation(self):
         pass
 
 #leaf
 class Leaf(Component):
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
     
@@ -30,6 +34,8 @@ class Leaf(Component):
 
 #Composite
 class Composite(Component):
+    __slots__ = ('name', 'children')
+
     def __init__(self, name):
         self.name = name
         self.children = []
@@ -65,4 +71,5 @@ def client():
     print(c2)
 
 
-client()
\ No newline at end of file
+if __name__ == '__main__':
+    client()
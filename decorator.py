@@ -16,24 +16,32 @@ from abc import ABC, abstractmethod
 
 #Abstract Component
 class Page(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def show(self):
         pass
 
 #Concrete component
 class AuthenticationPage(Page):
+    __slots__ = ()
+
     def show(self):
         print('show auth page!!')
 
 
 #Concrete component
 class AnonymousPage(Page):
+    __slots__ = ()
+
     def show(self):
         print('show anon page!!')
 
 
 #Abstract Decorator
 class PageDecorator(Page, ABC):
+    __slots__ = ('_component',)
+
     def __init__(self, component):
         self._component = component
     
@@ -43,6 +51,8 @@ class PageDecorator(Page, ABC):
 
 #Concrete decorator
 class AuthenticationDecorator(PageDecorator):
+    __slots__ = ()
+
     def show(self):
         component = self._component
         username = input('username : ')
@@ -58,4 +68,5 @@ def client():
     auth_decorator = AuthenticationDecorator(aut_page)
     auth_decorator.show()
 
-client()
\ No newline at end of file
+if __name__ == '__main__':
+    client()
@@ -0,0 +1,43 @@
+"""
+Runs the demo client of a pattern module.
+Importing a pattern module has no side effects, the demos only run here
+(or when a module is executed directly):
+
+    python demo.py proxy
+    python demo.py Creational.builder
+    python demo.py            # lists the available demos
+"""
+
+import runpy
+import sys
+
+MODULES = [
+    'adapter',
+    'bridge',
+    'composite',
+    'decorator',
+    'facade',
+    'proxy',
+    'Creational.abstract_factory',
+    'Creational.builder',
+    'Creational.factory_method',
+    'Creational.prototype',
+    'Creational.singleton',
+]
+
+
+def main(argv):
+    if not argv:
+        print('usage: python demo.py <module>\n')
+        print('\n'.join(MODULES))
+        return 0
+    name = argv[0]
+    if name not in MODULES:
+        print(f'unknown demo: {name}')
+        return 1
+    runpy.run_module(name, run_name='__main__', alter_sys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -13,23 +13,31 @@ Key Components:
 
 #Subsystem
 class Cpu:
+    __slots__ = ()
+
     def execute(self):
         print('executing...')
 
 
 #Subsystem
 class Memory:
+    __slots__ = ()
+
     def load(self):
         print('loading from memory...')
 
 
 #Subsystem
 class Ssd:
+    __slots__ = ()
+
     def read(self):
         print('reading from ssd...')
 
 #Facade
 class Computer:
+    __slots__ = ('cpu', 'memory', 'ssd')
+
     def __init__(self):
         self.cpu = Cpu()
         self.memory = Memory()
@@ -46,4 +54,5 @@ def client():
     computer.start()
 
 
-client()
\ No newline at end of file
+if __name__ == '__main__':
+    client()
@@ -0,0 +1,53 @@
+"""
+Import time check:
+    Imports every pattern module in a fresh interpreter with -X importtime
+    and fails (exit status 1) when a module's cumulative import time goes
+    over its budget. Importing a module must never run its demo.
+
+    python importtime.py
+"""
+
+import os
+import subprocess
+import sys
+
+from demo import MODULES
+
+# microseconds, cumulative (the module and everything it imports)
+DEFAULT_BUDGET = 25_000
+BUDGETS = {
+    'Creational': 5_000,
+}
+
+
+def import_time(module):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if result.stdout:
+        raise AssertionError(f'importing {module} printed output: {result.stdout!r}')
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f'no import time reported for {module}')
+
+
+def main():
+    failed = False
+    for module in ['Creational'] + MODULES:
+        cumulative = import_time(module)
+        budget = BUDGETS.get(module, DEFAULT_BUDGET)
+        status = 'ok' if cumulative <= budget else 'OVER BUDGET'
+        failed = failed or cumulative > budget
+        print(f'{module:32} {cumulative:>8} us  (budget {budget} us)  {status}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Instrumentation hooks for the pattern dispatch points.
+
+A Tracer times and counts calls by replacing the methods at the dispatch
+points with timing wrappers while it is enabled. disable() puts the
+original functions back, so a disabled tracer costs nothing: no flag is
+checked on the hot path.
+
+    tracer = Tracer()
+    with tracer:
+        ProxyServer(Server()).receive()
+    tracer.export_chrome_trace('trace.json')   # chrome://tracing, Perfetto
+    tracer.export_json('metrics.json')         # span tree + histograms
+"""
+
+import functools
+import importlib
+import json
+import os
+import threading
+import time
+
+# (module, class, method); subclasses overriding the method are patched too
+DEFAULT_TARGETS = [
+    ('proxy', 'ProxyServer', 'receive'),
+    ('decorator', 'PageDecorator', 'show'),
+    ('bridge', 'Abstraction', 'perform_action'),
+    ('composite', 'Composite', 'operation'),
+    ('Creational.factory_method', 'DocumentCreator', 'operation'),
+]
+
+
+class Tracer:
+    def __init__(self, targets=DEFAULT_TARGETS, record_spans=True):
+        self.targets = list(targets)
+        self.record_spans = record_spans
+        self.roots = []
+        self.stats = {}
+        self._local = threading.local()
+        self._patched = []
+    
+    def __enter__(self):
+        self.enable()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.disable()
+    
+    @property
+    def enabled(self):
+        return bool(self._patched)
+    
+    def enable(self):
+        if self._patched:
+            return
+        for module_name, class_name, method_name in self.targets:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            for klass in _class_tree(cls):
+                func = klass.__dict__.get(method_name)
+                if func is None or getattr(func, '__isabstractmethod__', False):
+                    continue
+                label = f'{klass.__name__}.{method_name}'
+                setattr(klass, method_name, self._wrap(func, label))
+                self._patched.append((klass, method_name, func))
+    
+    def disable(self):
+        while self._patched:
+            klass, method_name, func = self._patched.pop()
+            setattr(klass, method_name, func)
+    
+    def reset(self):
+        self.roots = []
+        self.stats = {}
+    
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+    
+    def _wrap(self, func, label):
+        clock = time.perf_counter_ns
+        record_spans = self.record_spans
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = self._stack()
+            span = {'name': label, 'tid': threading.get_ident(), 'start_ns': clock(),
+                    'dur_ns': 0, 'children_ns': 0, 'children': []}
+            if stack:
+                stack[-1]['children'].append(span)
+            elif record_spans:
+                self.roots.append(span)
+            stack.append(span)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stack.pop()
+                span['dur_ns'] = duration = clock() - span['start_ns']
+                if stack:
+                    stack[-1]['children_ns'] += duration
+                if not record_spans:
+                    span['children'] = []
+                self._record(label, duration, duration - span['children_ns'])
+        return wrapper
+    
+    def _record(self, label, duration, self_time):
+        stat = self.stats.get(label)
+        if stat is None:
+            stat = self.stats[label] = {'count': 0, 'total_ns': 0, 'self_ns': 0, 'histogram': {}}
+        stat['count'] += 1
+        stat['total_ns'] += duration
+        stat['self_ns'] += self_time
+        # log2 buckets: key k counts calls that took [2**(k-1), 2**k) ns
+        bucket = duration.bit_length()
+        histogram = stat['histogram']
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+    
+    def span_tree(self):
+        def convert(span):
+            return {
+                'name': span['name'],
+                'tid': span['tid'],
+                'start_ns': span['start_ns'],
+                'dur_ns': span['dur_ns'],
+                'self_ns': span['dur_ns'] - span['children_ns'],
+                'children': [convert(child) for child in span['children']],
+            }
+        return [convert(span) for span in self.roots]
+    
+    def histograms(self):
+        return {
+            label: {
+                'count': stat['count'],
+                'total_ns': stat['total_ns'],
+                'self_ns': stat['self_ns'],
+                'buckets_ns': {2 ** bucket: count for bucket, count in sorted(stat['histogram'].items())},
+            }
+            for label, stat in self.stats.items()
+        }
+    
+    def export_json(self, path):
+        with open(path, 'w') as f:
+            json.dump({'spans': self.span_tree(), 'histograms': self.histograms()}, f, indent=2)
+    
+    def export_chrome_trace(self, path):
+        events = []
+        pid = os.getpid()
+        def walk(span):
+            events.append({
+                'name': span['name'], 'ph': 'X', 'pid': pid, 'tid': span['tid'],
+                'ts': span['start_ns'] / 1000, 'dur': span['dur_ns'] / 1000,
+            })
+            for child in span['children']:
+                walk(child)
+        for span in self.roots:
+            walk(span)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ns'}, f)
+
+
+def _class_tree(cls):
+    yield cls
+    for subclass in cls.__subclasses__():
+        yield from _class_tree(subclass)
@@ -0,0 +1,106 @@
+"""
+Memory report for the slotted pattern participants.
+
+Prints bytes/object (measured with tracemalloc) for every participant
+next to a __dict__ based object holding the same attributes, and checks
+that the classes still have no __dict__ (except the EXTENSIBLE ones) and
+that the ABC abstractmethod contracts still hold. Exits with status 1
+when a check fails.
+
+    python memory_report.py
+"""
+
+import sys
+import tracemalloc
+
+import bridge
+import composite
+import decorator
+import facade
+import proxy
+from Creational import builder, prototype
+
+N = 10_000
+
+
+def participants():
+    # name -> (class, constructor arguments)
+    return {
+        'Leaf': (composite.Leaf, ('leaf',)),
+        'Composite': (composite.Composite, ('composite',)),
+        'House': (builder.House, ('one', '10', 'stone')),
+        'Person': (prototype.Person, ('a', 15)),
+        'Server': (proxy.Server, ()),
+        'ProxyServer': (proxy.ProxyServer, (None,)),
+        'AuthenticationDecorator': (decorator.AuthenticationDecorator, (None,)),
+        'RefinedAbstractionOne': (bridge.RefinedAbstractionOne, (None,)),
+        'RefinedAbstractionTwo': (bridge.RefinedAbstractionTwo, (None,)),
+        'Cpu': (facade.Cpu, ()),
+        'Memory': (facade.Memory, ()),
+        'Ssd': (facade.Ssd, ()),
+        'Computer': (facade.Computer, ()),
+    }
+
+
+# participants that keep a lazily allocated __dict__ for extra attributes
+EXTENSIBLE = {'Person'}
+
+
+# abstract participants must still refuse to be instantiated
+ABSTRACT = [
+    composite.Component,
+    proxy.AbstractServer,
+    decorator.Page,
+    decorator.PageDecorator,
+    bridge.Abstraction,
+    bridge.Implementation,
+    builder.HouseBuilder,
+    prototype.Prototype,
+]
+
+
+def dict_twin(cls):
+    # same __init__, regular __dict__ based instances
+    return type(cls.__name__, (), {'__init__': cls.__init__})
+
+
+def bytes_per_object(factory):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(N)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the objects is not part of their size
+    return (after - before) / N - 8, objects
+
+
+def main():
+    failures = []
+    print(f"{'bytes/object':26} {'slotted':>10} {'__dict__':>10}")
+    for name, (cls, args) in participants().items():
+        slotted, objects = bytes_per_object(lambda: cls(*args))
+        twin = dict_twin(cls)
+        plain, _ = bytes_per_object(lambda: twin(*args))
+        print(f'{name:26} {slotted:>10.0f} {plain:>10.0f}')
+        if hasattr(objects[0], '__dict__') and name not in EXTENSIBLE:
+            failures.append(f'{name} instances still have a __dict__')
+
+    for cls in ABSTRACT:
+        if not cls.__abstractmethods__:
+            failures.append(f'{cls.__name__} lost its abstract methods')
+            continue
+        try:
+            # object.__new__ refuses abstract classes before __init__ runs
+            cls.__new__(cls)
+        except TypeError as e:
+            if 'abstract' in str(e):
+                continue
+        failures.append(f'{cls.__name__} can be instantiated but is abstract')
+
+    for failure in failures:
+        print('FAIL:', failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -20,39 +20,307 @@ Types of Proxies:
 """
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from datetime import datetime
+import queue
+import threading
 import time
 
 #subject
 class AbstractServer(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def receive(self):
         pass
 
 #real subject
 class Server(AbstractServer):
+    __slots__ = ('service_time', '_sleep')
+
+    # sleep is injectable so benchmarks and tests can use a fake clock
+    def __init__(self, service_time=1, sleep=time.sleep):
+        self.service_time = service_time
+        self._sleep = sleep
+    
     def receive(self):
         print('request received .. starting process..')
-        time.sleep(1)
+        self._sleep(self.service_time)
         print('done')
 
 #proxy
 class ProxyServer(AbstractServer):
-    def __init__(self, server):
+    __slots__ = ('_server', '_log_path')
+
+    def __init__(self, server, log_path='log.log'):
         self._server = server
+        self._log_path = log_path
     
     def receive(self):
         self.logging()
         self._server.receive()
     
     def logging(self):
-        with open('log.log', 'a') as f:
+        with open(self._log_path, 'a') as f:
             f.write(f'request time : {datetime.now()} \n')
 
+class Principal(namedtuple('Principal', 'name roles')):
+    # roles are stored as a frozenset so principals can key the policy cache
+    __slots__ = ()
+
+    def __new__(cls, name, roles):
+        if isinstance(roles, str):
+            raise TypeError('roles must be a collection of role names, not a str')
+        return super().__new__(cls, name, frozenset(roles))
+
+
+#access policy
+class AccessPolicy:
+    """
+    Role/permission rules compiled into bitsets: every permission gets a
+    bit and every role the mask of its permissions. A principal's mask is
+    the OR of its roles' masks. It only depends on the principal's role
+    set, so masks are cached per role set (at most max_cached of them)
+    until the policy changes, and a check is a dict lookup and an AND.
+    """
+    def __init__(self, rules=(), max_cached=4096):
+        self._bits = {}
+        self._roles = {}
+        self._masks = {}
+        self._max_cached = max_cached
+        self._lock = threading.Lock()
+        self.version = 0
+        for role, permission in rules:
+            self._add(role, permission)
+    
+    def _add(self, role, permission):
+        bit = self._bits.get(permission)
+        if bit is None:
+            bit = self._bits[permission] = 1 << len(self._bits)
+        self._roles[role] = self._roles.get(role, 0) | bit
+    
+    def allow(self, role, permission):
+        with self._lock:
+            self._add(role, permission)
+            self._invalidate()
+    
+    def revoke(self, role, permission):
+        with self._lock:
+            bit = self._bits.get(permission, 0)
+            self._roles[role] = self._roles.get(role, 0) & ~bit
+            self._invalidate()
+    
+    def _invalidate(self):
+        self._masks.clear()
+        self.version += 1
+    
+    def check(self, principal, permission):
+        roles = principal.roles
+        mask = self._masks.get(roles)
+        if mask is None:
+            version = self.version
+            mask = 0
+            for role in roles:
+                mask |= self._roles.get(role, 0)
+            # a policy change while the mask was computed makes it stale,
+            # so it is only cached when the version is still the same
+            with self._lock:
+                if self.version == version:
+                    if len(self._masks) >= self._max_cached:
+                        self._masks.clear()
+                    self._masks[roles] = mask
+        return mask & self._bits.get(permission, 0) != 0
+
+
+#protection proxy
+class ProtectionProxy(AbstractServer):
+    __slots__ = ('_server', '_policy', '_principal', '_permission')
+
+    def __init__(self, server, policy, principal, permission='receive'):
+        self._server = server
+        self._policy = policy
+        self._principal = principal
+        self._permission = permission
+    
+    def receive(self):
+        if not self._policy.check(self._principal, self._permission):
+            raise PermissionError(f'{self._principal.name} may not {self._permission}')
+        self._server.receive()
+
+class ServerOverloaded(RuntimeError):
+    pass
+
+
+class ProxyClosed(RuntimeError):
+    pass
+
+
+#token bucket rate limiter
+class TokenBucket:
+    __slots__ = ('rate', 'capacity', '_tokens', '_last', '_clock', '_lock')
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._clock = clock
+        self._last = clock()
+        self._lock = threading.Lock()
+    
+    def try_acquire(self):
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class _Request:
+    __slots__ = ('enqueued', 'done', 'error')
+
+    def __init__(self, enqueued):
+        self.enqueued = enqueued
+        self.done = threading.Event()
+        self.error = None
+
+
+#smart reference proxy
+class SmartReferenceProxy(AbstractServer):
+    """
+    Admits requests through a token bucket and a bounded queue; requests
+    over the rate or arriving at a full queue are shed with
+    ServerOverloaded. A worker coalesces the requests that arrive within
+    batch_window into a single server.receive() call and then releases
+    every caller of that batch. After close() new requests raise
+    ProxyClosed; requests admitted before it are still served.
+    """
+    __slots__ = ('_server', '_bucket', '_queue', '_batch_window', '_max_batch',
+                 '_clock', '_lock', '_stats', '_worker', '_admission', '_closed')
+
+    def __init__(self, server, rate=100.0, burst=10, max_queue=100,
+                 batch_window=0.01, max_batch=64, clock=time.monotonic):
+        self._server = server
+        self._bucket = TokenBucket(rate, burst, clock)
+        self._queue = queue.Queue(max_queue)
+        self._batch_window = batch_window
+        self._max_batch = max_batch
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = {'requests': 0, 'batches': 0, 'rate_limited': 0, 'shed': 0, 'latency_histogram': {}}
+        self._admission = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+    
+    def receive(self):
+        if self._closed:
+            raise ProxyClosed('proxy is closed')
+        if not self._bucket.try_acquire():
+            self._count('rate_limited')
+            raise ServerOverloaded('rate limit exceeded')
+        request = _Request(self._clock())
+        # admission and close() are serialized, so nothing can be queued
+        # behind the shutdown sentinel
+        with self._admission:
+            if self._closed:
+                raise ProxyClosed('proxy is closed')
+            try:
+                self._queue.put_nowait(request)
+            except queue.Full:
+                self._count('shed')
+                raise ServerOverloaded('admission queue is full')
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+    
+    def close(self):
+        with self._admission:
+            closing = not self._closed
+            self._closed = True
+        if closing:
+            # the worker keeps draining, so this put cannot block forever
+            self._queue.put(None)
+        self._worker.join()
+    
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+    
+    def _run(self):
+        try:
+            self._serve_until_closed()
+        finally:
+            self._fail_pending()
+    
+    def _serve_until_closed(self):
+        get = self._queue.get
+        while True:
+            request = get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = self._clock() + self._batch_window
+            while len(batch) < self._max_batch:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                try:
+                    request = get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._serve(batch)
+                    return
+                batch.append(request)
+            self._serve(batch)
+    
+    def _fail_pending(self):
+        # nothing should be left once admission is closed, but no caller
+        # may be left waiting on a request the worker will never serve
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None:
+                request.error = ProxyClosed('proxy is closed')
+                request.done.set()
+    
+    def _serve(self, batch):
+        error = None
+        try:
+            self._server.receive()
+        except Exception as e:
+            error = e
+        now = self._clock()
+        with self._lock:
+            stats = self._stats
+            stats['batches'] += 1
+            stats['requests'] += len(batch)
+            histogram = stats['latency_histogram']
+            for request in batch:
+                # log2 buckets of the latency in microseconds
+                bucket = 2 ** int((now - request.enqueued) * 1e6).bit_length()
+                histogram[bucket] = histogram.get(bucket, 0) + 1
+        for request in batch:
+            request.error = error
+            request.done.set()
+    
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats, latency_histogram=dict(sorted(self._stats['latency_histogram'].items())))
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
+
 #client
 def client(server, proxy):
     s = server()
     p = proxy(s)
     p.receive()
 
-client(Server, ProxyServer)
+if __name__ == '__main__':
+    client(Server, ProxyServer)
+
@@ -0,0 +1,25 @@
+import unittest
+
+from Creational.abstract_factory import (
+    ConcreteFactory1, GUIFamily, ProductFamily, SharedProductFactory, WindowsFactory,
+)
+
+
+class SharedProductFactoryTest(unittest.TestCase):
+    def test_family_built_from_create_methods(self):
+        family = SharedProductFactory(ConcreteFactory1()).create_family()
+        self.assertEqual(family._fields, ('product_a', 'product_b'))
+        self.assertEqual(family.product_a.useful_function_a(), 'The result of the product A1.')
+
+    def test_explicit_family(self):
+        shared = SharedProductFactory(ConcreteFactory1(), ProductFamily)
+        self.assertIs(shared.create_family().product_b, shared.create_product_b())
+
+    def test_family_field_without_create_method(self):
+        with self.assertRaisesRegex(ValueError, 'create_button'):
+            SharedProductFactory(ConcreteFactory1(), GUIFamily)
+        self.assertIsInstance(SharedProductFactory(WindowsFactory(), GUIFamily).create_family(), GUIFamily)
+
+
+if __name__ == '__main__':
+    unittest.main()
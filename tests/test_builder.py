@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from Creational.builder import (
+    AsyncConstructionDirector, AsyncCustomHouseBuilder, ConstructionDirector,
+    HouseBuilder, HouseOneBuilder, build_house,
+)
+
+
+#Builder written against the original, stateful step contract
+class StatefulBuilder(HouseBuilder):
+    def build_foundation(self):
+        self.house.foundation = 'stateful'
+
+    def build_walls(self):
+        self.house.walls = '30'
+
+    def build_roof(self):
+        self.house.roof = 'tile'
+
+
+class StatefulBuilderTest(unittest.TestCase):
+    def test_construct(self):
+        director = ConstructionDirector()
+        director.set_house_builder(StatefulBuilder())
+        director.construct()
+        self.assertEqual(director.get_house().foundation, 'stateful')
+
+    def test_compile_and_batch(self):
+        director = ConstructionDirector()
+        director.set_house_builder(StatefulBuilder())
+        self.assertEqual(director.compile().execute().roof, 'tile')
+        houses = list(director.construct_many(10))
+        self.assertEqual({house.walls for house in houses}, {'30'})
+        self.assertEqual(len({id(house) for house in houses}), 10)
+
+    def test_parallel_steps(self):
+        with ThreadPoolExecutor(2) as executor:
+            house = build_house(StatefulBuilder(), executor)
+        self.assertEqual((house.foundation, house.walls, house.roof), ('stateful', '30', 'tile'))
+
+
+class ReentrantBuilderTest(unittest.TestCase):
+    def test_shared_builder_builds_distinct_houses(self):
+        director = ConstructionDirector()
+        director.set_house_builder(HouseOneBuilder())
+        houses = list(director.construct_many(10))
+        self.assertEqual(len({id(house) for house in houses}), 10)
+        self.assertEqual(str(houses[0]), 'house with foundation=one, walls=10, roof=stone')
+
+
+class AsyncConstructionDirectorTest(unittest.TestCase):
+    def test_cancelling_one_construct_keeps_shared_steps_running(self):
+        director = AsyncConstructionDirector()
+
+        async def main():
+            first = asyncio.ensure_future(director.construct(AsyncCustomHouseBuilder(delay=0.05)))
+            second = asyncio.ensure_future(director.construct(AsyncCustomHouseBuilder(delay=0.05)))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            house = await second
+            self.assertTrue(first.cancelled())
+            return house
+
+        house = asyncio.run(main())
+        self.assertEqual(str(house), 'house with foundation=one, walls=10, roof=stone')
+        self.assertEqual(director._inflight, {})
+
+    def test_cancelling_every_construct_cancels_the_step(self):
+        director = AsyncConstructionDirector()
+
+        async def main():
+            constructs = [asyncio.ensure_future(director.construct(AsyncCustomHouseBuilder(delay=0.05)))
+                          for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for construct in constructs:
+                construct.cancel()
+            await asyncio.gather(*constructs, return_exceptions=True)
+            await asyncio.sleep(0)
+            return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        self.assertEqual(asyncio.run(main()), [])
+        self.assertEqual(director._inflight, {})
+        self.assertEqual(director._cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import io
+import time
+import unittest
+
+from Creational.factory_method import ExportPipeline, document_registry
+
+
+class ExportPipelineTest(unittest.TestCase):
+    def test_rare_format_streams_before_end_of_input(self):
+        output = io.StringIO()
+        seen_before_end = []
+
+        def jobs():
+            yield ('pdf', 0)
+            for i in range(1, 6):
+                time.sleep(0.02)
+                yield ('html', i)
+            seen_before_end.append(output.getvalue())
+
+        metrics = ExportPipeline(output, max_delay=0.01).run(jobs())
+        self.assertIn('Exporting document 0: DocumentCreator: PDF document created', seen_before_end[0])
+        self.assertEqual(metrics['jobs'], 6)
+
+    def test_latency_measures_rendering_not_the_job_source(self):
+        def jobs():
+            for i in range(4):
+                time.sleep(0.05)
+                yield ('pdf', i)
+
+        metrics = ExportPipeline(io.StringIO()).run(jobs())
+        self.assertLess(metrics['batch_latency_p99'], 0.05)
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(KeyError):
+            document_registry.creator('odt')
+        metrics = ExportPipeline(io.StringIO()).run([('odt', 1), ('pdf', 2)])
+        self.assertEqual((metrics['jobs'], metrics['rejected']), (1, {'odt': 1}))
+
+
+if __name__ == '__main__':
+    unittest.main()
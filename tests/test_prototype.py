@@ -0,0 +1,22 @@
+import unittest
+
+from Creational.prototype import ConcretePrototype, Person, PrototypePool
+
+
+class PrototypePoolTest(unittest.TestCase):
+    def setUp(self):
+        prototype = ConcretePrototype()
+        prototype.register('p', Person('a', 15))
+        self.pool = PrototypePool(prototype, 'p')
+
+    def test_recycled_object_drops_extra_attributes(self):
+        obj = self.pool.acquire(nickname='x', age=30)
+        self.pool.release(obj)
+        recycled = self.pool.acquire()
+        self.assertIs(recycled, obj)
+        self.assertFalse(hasattr(recycled, 'nickname'))
+        self.assertEqual((recycled.name, recycled.age), ('a', 15))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from proxy import AccessPolicy, Principal
+
+
+class AccessPolicyTest(unittest.TestCase):
+    def test_cache_is_keyed_by_role_set(self):
+        policy = AccessPolicy([('user', 'receive')])
+        for i in range(1_000):
+            self.assertTrue(policy.check(Principal(f'user{i}', ['user']), 'receive'))
+        self.assertEqual(len(policy._masks), 1)
+
+    def test_cache_is_bounded(self):
+        policy = AccessPolicy([('role0', 'receive')], max_cached=10)
+        for i in range(100):
+            policy.check(Principal('bob', [f'role{i}']), 'receive')
+        self.assertLessEqual(len(policy._masks), 10)
+
+    def test_revoke_invalidates_cached_mask(self):
+        policy = AccessPolicy([('admin', 'receive')])
+        principal = Principal('alice', ['admin'])
+        self.assertTrue(policy.check(principal, 'receive'))
+        policy.revoke('admin', 'receive')
+        self.assertFalse(policy.check(principal, 'receive'))
+
+
+if __name__ == '__main__':
+    unittest.main()